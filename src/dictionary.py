@@ -4,100 +4,65 @@ A command-line interface (CLI) for a Spanish dictionary that
 helps non spanish speakers learn Spanish words and their meanings.
 """
 import argparse
+import asyncio
+import functools
 import os
+import sys
+from concurrent.futures import ThreadPoolExecutor
+from pathlib import Path
 import cloudscraper
+import diskcache
+import httpx
 from google import genai
-from bs4 import BeautifulSoup
-class Word:
+from selectolax.lexbor import LexborHTMLParser
+
+RAE_URL = "https://dle.rae.es"
+CACHE_DIR = os.path.expanduser("~/.cache/rae")
+CACHE_EXPIRE = 86400
+
+INTRO_SEL = "div.c-text-intro"
+DEFS_SEL = "li.j"
+WOTD_SEL = "span.c-word-day__word"
+# Only present on the "word not found" page, so misses can skip parsing.
+NOT_FOUND_MARKER = b'class="o-main__title-form-message"'
+
+GEMINI_MODEL = "gemini-2.0-flash"
+# Rough character budget for one prompt, well below the model's context window.
+MAX_PROMPT_CHARS = 1_000_000
+TRANSLATION_DELIMITER = "---"
+BATCH_INSTRUCTIONS = (
+    "The definitions below are grouped into blocks separated by a line containing "
+    f"only '{TRANSLATION_DELIMITER}'. Translate each block on its own and separate "
+    f"your translations with the same '{TRANSLATION_DELIMITER}' line, in the same order."
+)
+
+@functools.lru_cache(maxsize=1)
+def _get_prompt() -> str:
     """
-    A class for scraping and representing a word from the RAE (Real Academia Española)
-    dictionary website.
-
-    Attributes:
-        _url (str): The base URL of the RAE dictionary.
-
-        scraper (cloudscraper.CloudScraper):
-        The HTTP scraper instance configured for the specified browser and platform.
-
-        html_response (requests.Response): 
-        The HTTP response object containing the HTML of the dictionary page.
-
-        _word (str): The word being represented or scraped.
-
-    Args:
-        wordstr (str, optional): The initial word to represent. Defaults to "".
-        browser (str, optional): The browser type to emulate for scraping. Defaults to "firefox".
-        platform (str, optional): The platform type to emulate for scraping. Defaults to "linux".
-
-    Properties:
-        word (str): Gets or sets the current word.
-        url (str): Gets or sets the base URL for the dictionary.
-
-    Methods:
-        wotd():
-            Scrapes and updates the word of the day from the RAE dictionary homepage.
+    Reads the translation prompt that ships next to this module.
+    The file is read once and cached for the rest of the process.
     """
-    def __init__(self, wordstr:str = "", browser:str = "firefox", platform:str = "linux"):
-        self._url = "https://dle.rae.es"
-
-        self.scraper = cloudscraper.create_scraper(
-            browser={
-                "browser": f"{browser}",
-                "platform": f"{platform}",
-            },
-        )
-        self.html_response = self.scraper.get(url=self.url)
-        self._word = wordstr
-
-    @property
-    def word(self) -> str:
-        """
-        Getter for the word property.
-        """
-        return self._word
-
-    @word.setter
-    def word(self, word: str):
-        """
-        Setter for the word property.
-        """
-        self._word = word
-
-    @property
-    def url(self) -> str:
-        """
-        Getter for the url property.
-        """
-        return self._url
-
-    @url.setter
-    def url(self, url:str):
-        self._url = url
-
-
-    def wotd(self):
-        """
-        Extracts the 'word of the day' from the HTML response and
-        assigns it to the 'word' attribute.
-
-        Uses BeautifulSoup to parse the HTML content and finds the text within the
-        <span> element with class 'c-word-day__word'.
-
-        Raises:
-            AttributeError: If the expected element is not found in the HTML.
-        """
-        soup = BeautifulSoup(self.html_response.text, "html.parser")
-        self.word = soup.find("span", class_="c-word-day__word").text
+    return Path(__file__).with_name("prompt.txt").read_text(encoding="utf-8")
 
 class Dictionary:
     """
     A class for searching word definitions and retrieving the
     word of the day from an online dictionary.
 
+    Attributes
+    ----------
+    scraper (cloudscraper.CloudScraper):
+        The HTTP scraper shared by every lookup, so the Cloudflare challenge
+        is solved once and the connection is kept alive between requests.
+
+    _cache (diskcache.Cache):
+        On-disk cache of search results, keyed by the word as typed and
+        kept for CACHE_EXPIRE seconds, so repeated lookups skip the network.
+
     Methods
     -------
-    __init__():
-        Initializes the Dictionary instance.
+    __init__(browser: str = "firefox", platform: str = "linux"):
+        Initializes the Dictionary instance and its shared scraper.
 
     search_word(target: str):
         Searches for the given word in the dictionary,
@@ -109,19 +74,39 @@ class Dictionary:
             tuple: (intro_text, definitions) if found,
             or (error_message, []) if not found or on HTTP error.
 
+    search_word_async(target: str, session: httpx.AsyncClient):
+        Asynchronous counterpart of search_word that runs on an HTTP/2 httpx client.
+
+    search_many(targets: list[str]):
+        Searches for every given word concurrently.
+        Returns:
+            list: One search_word result tuple per target, in order.
+
     get_wotd():
         Retrieves and prints the word of the day, then searches for its definitions.
         Returns:
             tuple: The result of search_word for the word of the day.
     """
-    def __init__(self):
+    __slots__ = ("soup", "scraper", "_cache")
+
+    def __init__(self, browser:str = "firefox", platform:str = "linux"):
         self.soup = None
+        self.scraper = cloudscraper.create_scraper(
+            browser={
+                "browser": f"{browser}",
+                "platform": f"{platform}",
+            },
+        )
+        self._cache = diskcache.Cache(CACHE_DIR)
 
     def search_word(self, target: str):
         """
         Searches for the given word in the online dictionary,
         retrieves its introduction and definitions.
 
+        Results are served from the on-disk cache when the word
+        has been found before.
+
         Args:
             target (str): The word to search for.
 
@@ -133,88 +118,219 @@ class Dictionary:
                 - list or str: A list of definitions for the word,
                 or an empty list if not found or on error.
         """
-        word = Word(wordstr=target)
+        cached = self._cache.get(target)
+
+        if cached is not None:
+            return cached
+
+        url = RAE_URL + f"/{target}?m=form"
+
+        html_response = self.scraper.get(url=url)
+
+        return self._parse_response(target, html_response.status_code, html_response.content)
+
+    def _parse_response(self, target: str, status_code: int, html: bytes):
+        """
+        Parses a dictionary page into the (header, definitions) tuple
+        returned by search_word and search_word_async, and caches it
+        when definitions were found.
 
-        url = word.url + f"/{target}?m=form"
+        Pages containing NOT_FOUND_MARKER are reported as not found
+        without being parsed.
 
-        html_response = word.scraper.get(url=url)
+        Args:
+            target (str): The word that was searched for.
+            status_code (int): The HTTP status code of the response.
+            html (bytes): The raw HTML body of the response, handed to the
+            parser without decoding it to str first.
 
-        if html_response.status_code == 200:
-            self.soup = BeautifulSoup(html_response.text, "html.parser")
+        Returns:
+            tuple: See search_word.
+        """
+        if status_code == 200:
+            if NOT_FOUND_MARKER in html:
+                return f"Word '{target}' not found in the dictionary. Check the spelling.", []
 
-            if self.soup.find("div", class_="n2 c-text-intro"):
-                intro = self.soup.find("div", class_="n2 c-text-intro").text
+            self.soup = LexborHTMLParser(html)
 
-            else:
-                intro = ""
+            intro_node = self.soup.css_first(INTRO_SEL)
+            intro = intro_node.text() if intro_node is not None else ""
 
-            definitions = self.soup.find_all("li", class_="j")
+            definitions = self.soup.css(DEFS_SEL)
 
             if not definitions:
                 return f"Word '{target}' not found in the dictionary. Check the spelling.", []
 
-            return f"{target}:\n{intro}", "\n".join([definition.text for definition in definitions])
+            result = f"{target}:\n{intro}", "\n".join(definition.text() for definition in definitions)
+            self._cache.set(target, result, expire=CACHE_EXPIRE)
+
+            return result
 
         else:
-            return f"HTTP error code: {html_response.status_code}", []
+            return f"HTTP error code: {status_code}", []
+
+    def _async_session(self) -> httpx.AsyncClient:
+        """
+        Builds an HTTP/2 httpx client that reuses the Cloudflare clearance of the
+        shared scraper.
+
+        cloudscraper is synchronous, so the challenge is solved once through it
+        (only if it has not been solved yet) and its cookies and browser headers
+        are copied into the httpx client, so the clearance cookie is presented
+        with the same fingerprint it was issued for.
+
+        Returns:
+            httpx.AsyncClient: A client whose concurrent requests are multiplexed
+            over a single HTTP/2 connection.
+        """
+        if not self.scraper.cookies:
+            self.scraper.get(url=RAE_URL)
+
+        return httpx.AsyncClient(
+            http2=True,
+            follow_redirects=True,
+            headers=dict(self.scraper.headers),
+            cookies=self.scraper.cookies.get_dict(),
+        )
+
+    async def search_word_async(self, target: str, session: httpx.AsyncClient):
+        """
+        Searches for the given word in the online dictionary without blocking
+        the event loop.
+
+        Args:
+            target (str): The word to search for.
+            session (httpx.AsyncClient): The client used for the request.
+
+        Returns:
+            tuple: See search_word.
+        """
+        cached = self._cache.get(target)
+
+        if cached is not None:
+            return cached
+
+        return await self._fetch_async(target, session)
+
+    async def _fetch_async(self, target: str, session: httpx.AsyncClient):
+        """
+        Fetches and parses the dictionary page for the given word, bypassing the cache.
+
+        Args:
+            target (str): The word to search for.
+            session (httpx.AsyncClient): The client used for the request.
+
+        Returns:
+            tuple: See search_word.
+        """
+        url = RAE_URL + f"/{target}?m=form"
+
+        html_response = await session.get(url)
+
+        return self._parse_response(target, html_response.status_code, html_response.content)
+
+    async def search_many(self, targets: list[str]):
+        """
+        Searches for several words concurrently over a single HTTP/2 connection.
+
+        Cached words are answered from the on-disk cache first; the Cloudflare
+        bootstrap and the HTTP/2 client are only set up when some words miss it.
+
+        Args:
+            targets (list[str]): The words to search for.
+
+        Returns:
+            list: One (header, definitions) tuple per target, in the same order.
+        """
+        results = [self._cache.get(target) for target in targets]
+        misses = [index for index, result in enumerate(results) if result is None]
+
+        if misses:
+            async with self._async_session() as session:
+                fetched = await asyncio.gather(
+                    *(self._fetch_async(targets[index], session) for index in misses)
+                )
+
+            for index, result in zip(misses, fetched):
+                results[index] = result
+
+        return results
 
     def get_wotd(self):
         """
         Retrieves and displays the word of the day.
 
-        This method creates a new Word instance, fetches the word of the day,
-        prints a header, and returns the result of searching for the word of the day.
+        This method fetches the dictionary homepage through the shared scraper,
+        reads the word of the day from it, prints a header, and returns the result
+        of searching for the word of the day.
 
         Returns:
             The result of searching for the word of the day using the search_word method.
         """
-        word = Word()
-        word.wotd()
+        html = self.scraper.get(url=RAE_URL).content
+        word = LexborHTMLParser(html).css_first(WOTD_SEL).text()
 
         print("Word of the day:\n")
-        return self.search_word(word.word)
+        return self.search_word(word)
 
 class Cli:
     """
     Command-line interface (CLI) class for interacting with a dictionary application.
     Attributes:
         dictionary (Dictionary): An instance of the Dictionary class used for word lookups.
-        argument (str): The word or phrase to be searched or processed.
-        _result (tuple or None): Stores the result of the latest dictionary operation.
-    Properties:
-        result (tuple or None): Gets or sets the result of the latest dictionary operation.
+        argument (list[str]): The words to be searched or processed.
+        result (list or None): Stores the (header, definitions) tuples
+        of the latest dictionary operation.
+        _client (genai.Client or None): Gemini client shared by every Cli instance,
+        created on the first translation.
     Methods:
         print_result(header: str, definitions: str):
             Prints the header and definitions to the console.
         execute_search():
-            Searches for the word specified in 'argument'
-            using the dictionary and stores the result.
+            Searches concurrently for the words specified in 'argument'
+            using the dictionary and stores the results.
 
         execute_wotd():
             Retrieves the word of the day from the dictionary and stores the result.
 
         execute_translation():
-            Translates the latest result using a prompt from a file and the Gemini API,
-            then prints the translation.
+            Translates the latest results using a prompt from a file and the Gemini API,
+            then prints the translations.
+
+        execute_translation_batch(results: list):
+            Translates several (header, definitions) tuples with a single Gemini request
+            and streams the translations to the console.
+
+        execute_and_translate(execute):
+            Runs a lookup while the translation is prepared on another thread,
+            then translates the results.
     """
-    def __init__(self,  argument:str = ""):
+    __slots__ = ("dictionary", "argument", "result")
+
+    _client: genai.Client | None = None
+
+    def __init__(self,  argument: list[str] | None = None):
         self.dictionary = Dictionary()
-        self.argument = argument
-        self._result = None
+        self.argument = argument or []
+        self.result = None
 
-    @property
-    def result(self):
+    @classmethod
+    def _client_get(cls) -> genai.Client:
         """
-        Getter for the result property.
+        Returns the shared Gemini client, creating it on first use.
         """
-        return self._result
+        if cls._client is None:
+            cls._client = genai.Client(api_key=os.environ["api_key"])
 
-    @result.setter
-    def result(self, result):
+        return cls._client
+
+    @classmethod
+    def _prepare_translation(cls):
         """
-        Setter for the result property.
+        Reads the prompt and builds the Gemini client ahead of the first translation.
         """
-        self._result = result
+        _get_prompt()
+        cls._client_get()
 
     def print_result(self, header:str, definitions:str):
         """
@@ -229,25 +345,29 @@ class Cli:
 
     def execute_search(self):
         """
-        Executes a search for the target word using the dictionary instance.
+        Executes a search for the target words using the dictionary instance.
 
-        Retrieves the header and definition for the specified target word (self.argument)
-        by calling the dictionary's search_word method. Stores the result as a tuple
-        (header, definition) in self.result.
+        Retrieves the header and definition for every target word (self.argument).
+        A single word goes through the dictionary's search_word method on the shared
+        scraper; several words are fetched concurrently through search_many. Stores the
+        results as a list of (header, definition) tuples in self.result.
         """
-        header, definition = self.dictionary.search_word(target=self.argument)
-        self.result = (header, definition)
+        if len(self.argument) == 1:
+            self.result = [self.dictionary.search_word(target=self.argument[0])]
+        else:
+            self.result = asyncio.run(self.dictionary.search_many(self.argument))
 
     def execute_wotd(self):
         """
         Retrieves the word of the day (WOTD) and its definition from the dictionary,
-        then stores the result as a tuple (header, definition) in the `self.result` attribute.
+        then stores the result as a one-element list of (header, definition)
+        tuples in the `self.result` attribute.
 
         Returns:
             None
         """
         header, definition = self.dictionary.get_wotd()
-        self.result = (header, definition)
+        self.result = [(header, definition)]
 
     def execute_translation(self):
         """
@@ -255,37 +375,97 @@ class Cli:
         appending the current translation results,
         and sending the combined prompt to the Gemini API for content generation.
 
-        If translation results are available, the method:
-            - Reads the prompt from 'prompt.txt'.
-            - Appends the source and translated text to the prompt.
+        The results with definitions are translated together through
+        execute_translation_batch, which prints the translations as they arrive.
+
+        For each result without definitions, prints its header instead, which
+        names the word that was not found or the HTTP error code.
+
+        Returns:
+            None
+        """
+        found = [result for result in self.result if result[1]]
+
+        for header, definitions in self.result:
+            if not definitions:
+                print(header)
+
+        if found:
+            self.execute_translation_batch(found)
+
+    def execute_translation_batch(self, results: list):
+        """
+        Translates several results with a single Gemini request.
+
+        The method:
+            - Reads the prompt from 'prompt.txt' (cached after the first read).
+            - Appends every (header, definitions) block, separated by TRANSLATION_DELIMITER.
             - Sends the prompt to the Gemini API using the specified model.
-            - Prints the generated response text.
+            - Writes the generated text to stdout chunk by chunk as it is streamed back,
+              keeping the delimiter lines as separators between translations.
+
+        If the combined prompt is longer than MAX_PROMPT_CHARS, each result
+        is sent in its own request instead.
 
-        If no translation results are found, prints a message and exits.
+        Args:
+            results (list): The (header, definitions) tuples to translate.
 
         Returns:
             None
         """
-        if self.result[1]:
-            with open("./prompt.txt", "r", encoding="utf-8") as file:
-                prompt = file.read()
-
-            prompt = f"{prompt}\n\n{self.result[0]}\n{self.result[1]}"
-            client = genai.Client(api_key=os.environ["api_key"])
-            response = client.models.generate_content(
-                model="gemini-2.0-flash", contents=prompt
-            )
-            print(response.text)
-        else:
-            print("No definitions found for the word.")
+        client = self._client_get()
+        blocks = [f"{header}\n{definitions}" for header, definitions in results]
+        prompt = (
+            f"{_get_prompt()}\n\n{BATCH_INSTRUCTIONS}\n\n"
+            + f"\n{TRANSLATION_DELIMITER}\n".join(blocks)
+        )
+
+        if len(prompt) > MAX_PROMPT_CHARS and len(results) > 1:
+            for result in results:
+                self.execute_translation_batch([result])
             return
 
+        for chunk in client.models.generate_content_stream(model=GEMINI_MODEL, contents=prompt):
+            if chunk.text:
+                sys.stdout.write(chunk.text)
+                sys.stdout.flush()
+
+        sys.stdout.write("\n")
+
+    def execute_and_translate(self, execute):
+        """
+        Runs a lookup and the translation setup concurrently, then translates.
+
+        The lookup (execute_search or execute_wotd) is network bound, so reading
+        the prompt and creating the Gemini client on a second thread hides their
+        cost behind it.
+
+        A failure while preparing the translation (e.g. no api_key set) is only
+        raised when there are definitions to translate.
+
+        Args:
+            execute (callable): The bound lookup method to run, e.g. self.execute_wotd.
+
+        Returns:
+            None
+        """
+        with ThreadPoolExecutor(max_workers=2) as executor:
+            lookup = executor.submit(execute)
+            warmup = executor.submit(self._prepare_translation)
+            lookup.result()
+
+            if any(definitions for _, definitions in self.result):
+                warmup.result()
+
+        self.execute_translation()
+
 if __name__ == "__main__":
     parser = argparse.ArgumentParser(prog= "Spanish dictionary",
                                      description="A spanish dictionary to teach words in " \
                                      "spanish and thgeir meaning.")
 
-    parser.add_argument('-s', '--search', help="Search for the definition of a Spanish word.")
+    parser.add_argument('-s', '--search', nargs='+',
+                        help="Search for the definition of one or more Spanish words.")
     parser.add_argument('-w', '--wotd',
                         help="Show the word of the day and its definition.",
                         action='store_true')
@@ -301,21 +481,23 @@ if __name__ == "__main__":
 
     if args.wotd:
         cli = Cli()
-        cli.execute_wotd()
         if args.translate:
-            cli.execute_translation()
+            cli.execute_and_translate(cli.execute_wotd)
         else:
-            cli.print_result(*cli.result)
+            cli.execute_wotd()
+            for result in cli.result:
+                cli.print_result(*result)
 
     elif args.search:
         cli = Cli(args.search)
-        cli.execute_search()
 
         if args.translate:
-            cli.execute_translation()
+            cli.execute_and_translate(cli.execute_search)
 
         else:
-            cli.print_result(*cli.result)
+            cli.execute_search()
+            for result in cli.result:
+                cli.print_result(*result)
 
     else:
         print("No valid option picked")